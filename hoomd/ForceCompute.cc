@@ -11,6 +11,10 @@
 #include "Communicator.h"
 #endif
 
+#ifdef ENABLE_HIP
+#include "ForceCompute.cuh"
+#endif
+
 #include <iostream>
 using namespace std;
 
@@ -202,14 +206,33 @@ ForceCompute::~ForceCompute()
     }
 
 /*! Sums the total potential energy calculated by the last call to compute() and returns it.
+
+    On the GPU, the sum is reduced on the device so that only the result is copied to the host.
  */
 Scalar ForceCompute::calcEnergySum()
     {
-    ArrayHandle<Scalar4> h_force(m_force, access_location::host, access_mode::read);
     double pe_total = m_external_energy;
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+#ifdef ENABLE_HIP
+    if (m_exec_conf->isCUDAEnabled())
+        {
+        ArrayHandle<Scalar4> d_force(m_force, access_location::device, access_mode::read);
+        double pe_local = 0.0;
+        kernel::gpu_compute_energy_sum(&pe_local,
+                                       d_force.data,
+                                       m_pdata->getN(),
+                                       m_exec_conf->getCachedAllocator());
+        if (m_exec_conf->isCUDAErrorCheckingEnabled())
+            CHECK_CUDA_ERROR();
+        pe_total += pe_local;
+        }
+    else
+#endif
         {
-        pe_total += (double)h_force.data[i].w;
+        ArrayHandle<Scalar4> h_force(m_force, access_location::host, access_mode::read);
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            {
+            pe_total += (double)h_force.data[i].w;
+            }
         }
 #ifdef ENABLE_MPI
     if (m_sysdef->isDomainDecomposed())
@@ -338,13 +361,32 @@ pybind11::object ForceCompute::getEnergiesPython()
         }
     std::vector<double> energy(dims[0]);
 
-    // This is slow: TODO implement a proper gather operation
-    for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
+    if (m_sysdef->isDomainDecomposed())
         {
-        double e = getEnergy(i);
-        if (root)
+        // This is slow: TODO implement a proper gather operation
+        for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
             {
-            energy[i] = e;
+            double e = getEnergy(i);
+            if (root)
+                {
+                energy[i] = e;
+                }
+            }
+        }
+    else
+        {
+        // all particles are local: read the array once in tag order
+        ArrayHandle<Scalar4> h_force(m_force, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(),
+                                         access_location::host,
+                                         access_mode::read);
+        for (unsigned int tag = 0; tag < dims[0]; tag++)
+            {
+            unsigned int i = h_rtag.data[tag];
+            if (i < m_pdata->getN())
+                {
+                energy[tag] = h_force.data[i].w;
+                }
             }
         }
 
@@ -379,15 +421,36 @@ pybind11::object ForceCompute::getForcesPython()
         }
     std::vector<vec3<double>> force(dims[0]);
 
-    // This is slow: TODO implement a proper gather operation
-    for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
+    if (m_sysdef->isDomainDecomposed())
         {
-        Scalar3 f = getForce(i);
-        if (root)
+        // This is slow: TODO implement a proper gather operation
+        for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
             {
-            force[i].x = f.x;
-            force[i].y = f.y;
-            force[i].z = f.z;
+            Scalar3 f = getForce(i);
+            if (root)
+                {
+                force[i].x = f.x;
+                force[i].y = f.y;
+                force[i].z = f.z;
+                }
+            }
+        }
+    else
+        {
+        // all particles are local: read the array once in tag order
+        ArrayHandle<Scalar4> h_force(m_force, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(),
+                                         access_location::host,
+                                         access_mode::read);
+        for (unsigned int tag = 0; tag < dims[0]; tag++)
+            {
+            unsigned int i = h_rtag.data[tag];
+            if (i < m_pdata->getN())
+                {
+                force[tag].x = h_force.data[i].x;
+                force[tag].y = h_force.data[i].y;
+                force[tag].z = h_force.data[i].z;
+                }
             }
         }
 
@@ -422,15 +485,36 @@ pybind11::object ForceCompute::getTorquesPython()
         }
     std::vector<vec3<double>> torque(dims[0]);
 
-    // This is slow: TODO implement a proper gather operation
-    for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
+    if (m_sysdef->isDomainDecomposed())
         {
-        Scalar4 f = getTorque(i);
-        if (root)
+        // This is slow: TODO implement a proper gather operation
+        for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
             {
-            torque[i].x = f.x;
-            torque[i].y = f.y;
-            torque[i].z = f.z;
+            Scalar4 f = getTorque(i);
+            if (root)
+                {
+                torque[i].x = f.x;
+                torque[i].y = f.y;
+                torque[i].z = f.z;
+                }
+            }
+        }
+    else
+        {
+        // all particles are local: read the array once in tag order
+        ArrayHandle<Scalar4> h_torque(m_torque, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(),
+                                         access_location::host,
+                                         access_mode::read);
+        for (unsigned int tag = 0; tag < dims[0]; tag++)
+            {
+            unsigned int i = h_rtag.data[tag];
+            if (i < m_pdata->getN())
+                {
+                torque[tag].x = h_torque.data[i].x;
+                torque[tag].y = h_torque.data[i].y;
+                torque[tag].z = h_torque.data[i].z;
+                }
             }
         }
 
@@ -470,24 +554,46 @@ pybind11::object ForceCompute::getVirialsPython()
         }
     std::vector<double> virial(dims[0] * dims[1]);
 
-    // This is slow: TODO implement a proper gather operation
-    for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
+    if (m_sysdef->isDomainDecomposed())
         {
-        double v0 = getVirial(i, 0);
-        double v1 = getVirial(i, 1);
-        double v2 = getVirial(i, 2);
-        double v3 = getVirial(i, 3);
-        double v4 = getVirial(i, 4);
-        double v5 = getVirial(i, 5);
-
-        if (root)
+        // This is slow: TODO implement a proper gather operation
+        for (unsigned int i = 0; i < m_pdata->getNGlobal(); i++)
+            {
+            double v0 = getVirial(i, 0);
+            double v1 = getVirial(i, 1);
+            double v2 = getVirial(i, 2);
+            double v3 = getVirial(i, 3);
+            double v4 = getVirial(i, 4);
+            double v5 = getVirial(i, 5);
+
+            if (root)
+                {
+                virial[i * 6 + 0] = v0;
+                virial[i * 6 + 1] = v1;
+                virial[i * 6 + 2] = v2;
+                virial[i * 6 + 3] = v3;
+                virial[i * 6 + 4] = v4;
+                virial[i * 6 + 5] = v5;
+                }
+            }
+        }
+    else
+        {
+        // all particles are local: read the array once in tag order
+        ArrayHandle<Scalar> h_virial(m_virial, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(),
+                                         access_location::host,
+                                         access_mode::read);
+        for (unsigned int tag = 0; tag < dims[0]; tag++)
             {
-            virial[i * 6 + 0] = v0;
-            virial[i * 6 + 1] = v1;
-            virial[i * 6 + 2] = v2;
-            virial[i * 6 + 3] = v3;
-            virial[i * 6 + 4] = v4;
-            virial[i * 6 + 5] = v5;
+            unsigned int i = h_rtag.data[tag];
+            if (i < m_pdata->getN())
+                {
+                for (unsigned int k = 0; k < 6; k++)
+                    {
+                    virial[tag * 6 + k] = h_virial.data[m_virial_pitch * k + i];
+                    }
+                }
             }
         }
 
@@ -501,6 +607,19 @@ pybind11::object ForceCompute::getVirialsPython()
         }
     }
 
+pybind11::object ForceCompute::getExternalVirialsPython()
+    {
+    // fill the numpy buffer directly to avoid an intermediate copy
+    pybind11::array_t<double> external_virial(6);
+    double* data = external_virial.mutable_data();
+    for (unsigned int i = 0; i < 6; i++)
+        {
+        data[i] = getExternalVirial(i);
+        }
+
+    return external_virial;
+    }
+
 /*! Performs the force computation.
     \param timestep Current Timestep
     \note If compute() has previously been called with a value of timestep equal to
@@ -635,6 +754,7 @@ void export_ForceCompute(pybind11::module& m)
         .def("getEnergy", &ForceCompute::getEnergy)
         .def("getExternalEnergy", &ForceCompute::getExternalEnergy)
         .def("getExternalVirial", &ForceCompute::getExternalVirial)
+        .def("getExternalVirials", &ForceCompute::getExternalVirialsPython)
         .def("calcEnergySum", &ForceCompute::calcEnergySum)
         .def("getEnergies", &ForceCompute::getEnergiesPython)
         .def("getForces", &ForceCompute::getForcesPython)
@@ -0,0 +1,76 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#include "ForceCompute.cuh"
+
+#include <assert.h>
+
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#include <hipcub/hipcub.hpp>
+#pragma GCC diagnostic pop
+
+#include <thrust/iterator/transform_iterator.h>
+
+/*! \file ForceCompute.cu
+    \brief Defines GPU kernel code used by ForceCompute
+*/
+
+namespace hoomd
+    {
+namespace kernel
+    {
+//! Extract the potential energy from a force element in double precision
+struct force_energy : public thrust::unary_function<Scalar4, double>
+    {
+    __host__ __device__ double operator()(const Scalar4& f) const
+        {
+        return (double)f.w;
+        }
+    };
+
+/*! \param h_energy_sum Host pointer to write the sum to
+    \param d_force Device array of per particle forces (energy in w)
+    \param N Number of particles to sum over
+    \param alloc Caching allocator for temporary device storage
+
+    Only the 8 byte result is copied back to the host.
+*/
+hipError_t gpu_compute_energy_sum(double* h_energy_sum,
+                                  const Scalar4* d_force,
+                                  const unsigned int N,
+                                  CachedAllocator& alloc)
+    {
+    assert(h_energy_sum);
+
+    if (N == 0)
+        {
+        *h_energy_sum = 0.0;
+        return hipSuccess;
+        }
+
+    assert(d_force);
+
+    auto energy = thrust::make_transform_iterator(d_force, force_energy());
+    double* d_energy_sum = alloc.getTemporaryBuffer<double>(1);
+    assert(d_energy_sum);
+
+    // determine size of temporary storage
+    void* d_temp_storage = NULL;
+    size_t temp_storage_bytes = 0;
+    hipcub::DeviceReduce::Sum(d_temp_storage, temp_storage_bytes, energy, d_energy_sum, N);
+
+    d_temp_storage = alloc.allocate(temp_storage_bytes);
+    hipcub::DeviceReduce::Sum(d_temp_storage, temp_storage_bytes, energy, d_energy_sum, N);
+    alloc.deallocate((char*)d_temp_storage);
+
+    hipError_t status
+        = hipMemcpy(h_energy_sum, d_energy_sum, sizeof(double), hipMemcpyDeviceToHost);
+    alloc.deallocate((char*)d_energy_sum);
+
+    return status;
+    }
+
+    } // end namespace kernel
+
+    } // end namespace hoomd
@@ -0,0 +1,30 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+/*! \file ForceCompute.cuh
+    \brief Declares GPU kernel code used by ForceCompute
+*/
+
+#ifndef __FORCECOMPUTE_CUH__
+#define __FORCECOMPUTE_CUH__
+
+#include "HOOMDMath.h"
+#include "hoomd/CachedAllocator.h"
+
+#include <hip/hip_runtime.h>
+
+namespace hoomd
+    {
+namespace kernel
+    {
+//! Sum the per particle potential energies stored in the w component of the force array
+hipError_t gpu_compute_energy_sum(double* h_energy_sum,
+                                  const Scalar4* d_force,
+                                  const unsigned int N,
+                                  CachedAllocator& alloc);
+
+    } // end namespace kernel
+
+    } // end namespace hoomd
+
+#endif
@@ -111,6 +111,12 @@ class PYBIND11_EXPORT ForceCompute : public Compute
     */
     pybind11::object getVirialsPython();
 
+    /** Get all components of the additional virial
+
+        @returns a Numpy array with the 6 components of the external virial.
+    */
+    pybind11::object getExternalVirialsPython();
+
     //! Easy access to the torque on a single particle
     Scalar4 getTorque(unsigned int tag);
 
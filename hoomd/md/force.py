@@ -4,6 +4,7 @@
 """Apply forces to particles."""
 
 from abc import abstractmethod
+import functools
 
 import hoomd
 from hoomd.md import _md
@@ -14,7 +15,29 @@ from hoomd.data.typeconverter import OnlyTypes
 from hoomd.data.parameterdicts import ParameterDict, TypeParameterDict
 from hoomd.filter import ParticleFilter
 from hoomd.md.manifold import Manifold
-import numpy
+
+
+def _ensure_computed(method):
+    """Compute the force before evaluating a loggable quantity.
+
+    ``_cpp_obj.compute`` returns early when the forces are already up to date
+    for the current timestep, particle order, and particle data flags.
+    """
+
+    @functools.wraps(method)
+    def wrapped(self):
+        self._cpp_obj.compute(self._simulation.timestep)
+        return method(self)
+
+    return wrapped
+
+
+def _get_python_param(param_dict, key):
+    """Get a parameter that cannot change after attaching from Python.
+
+    Avoids querying the C++ object on every access.
+    """
+    return param_dict._dict[key]
 
 
 class Force(Compute):
@@ -75,13 +98,14 @@ class Force(Compute):
         self._in_context_manager = False
 
     @log(requires_run=True)
+    @_ensure_computed
     def energy(self):
         """float: The potential energy :math:`U` of the system from this force \
         :math:`[\\mathrm{energy}]`."""
-        self._cpp_obj.compute(self._simulation.timestep)
         return self._cpp_obj.calcEnergySum()
 
     @log(category="particle", requires_run=True)
+    @_ensure_computed
     def energies(self):
         """(*N_particles*, ) `numpy.ndarray` of ``float``: Energy \
         contribution :math:`U_i` from each particle :math:`[\\mathrm{energy}]`.
@@ -90,17 +114,17 @@ class Force(Compute):
             In MPI parallel execution, the array is available on rank 0 only.
             `energies` is `None` on ranks >= 1.
         """
-        self._cpp_obj.compute(self._simulation.timestep)
         return self._cpp_obj.getEnergies()
 
     @log(requires_run=True)
+    @_ensure_computed
     def additional_energy(self):
         """float: Additional energy term :math:`U_\\mathrm{additional}` \
         :math:`[\\mathrm{energy}]`."""
-        self._cpp_obj.compute(self._simulation.timestep)
         return self._cpp_obj.getExternalEnergy()
 
     @log(category="particle", requires_run=True)
+    @_ensure_computed
     def forces(self):
         """(*N_particles*, 3) `numpy.ndarray` of ``float``: The \
         force :math:`\\vec{F}_i` applied to each particle \
@@ -110,10 +134,10 @@ class Force(Compute):
             In MPI parallel execution, the array is available on rank 0 only.
             `forces` is `None` on ranks >= 1.
         """
-        self._cpp_obj.compute(self._simulation.timestep)
         return self._cpp_obj.getForces()
 
     @log(category="particle", requires_run=True)
+    @_ensure_computed
     def torques(self):
         """(*N_particles*, 3) `numpy.ndarray` of ``float``: The torque \
         :math:`\\vec{\\tau}_i` applied to each particle \
@@ -123,10 +147,10 @@ class Force(Compute):
             In MPI parallel execution, the array is available on rank 0 only.
             `torques` is `None` on ranks >= 1.
         """
-        self._cpp_obj.compute(self._simulation.timestep)
         return self._cpp_obj.getTorques()
 
     @log(category="particle", requires_run=True)
+    @_ensure_computed
     def virials(self):
         """(*N_particles*, 6) `numpy.ndarray` of ``float``: Virial tensor \
         contribution :math:`W_i` from each particle :math:`[\\mathrm{energy}]`.
@@ -143,18 +167,14 @@ class Force(Compute):
             In MPI parallel execution, the array is available on rank 0 only.
             `virials` is `None` on ranks >= 1.
         """
-        self._cpp_obj.compute(self._simulation.timestep)
         return self._cpp_obj.getVirials()
 
     @log(category="sequence", requires_run=True)
+    @_ensure_computed
     def additional_virial(self):
         """(1, 6) `numpy.ndarray` of ``float``: Additional virial tensor \
         term :math:`W_\\mathrm{additional}` :math:`[\\mathrm{energy}]`."""
-        self._cpp_obj.compute(self._simulation.timestep)
-        virial = []
-        for i in range(6):
-            virial.append(self._cpp_obj.getExternalVirial(i))
-        return numpy.array(virial, dtype=numpy.float64)
+        return self._cpp_obj.getExternalVirials()
 
     @property
     def cpu_local_force_arrays(self):
@@ -185,6 +205,9 @@ class Force(Compute):
                                "context manager")
         if not self._attached:
             raise hoomd.error.DataAccessError("cpu_local_force_arrays")
+        # Do not cache the accessor. It captures the local particle counts and
+        # the virial pitch when constructed, both of which change as particles
+        # migrate between ranks or the force arrays are reallocated.
         return hoomd.md.data.ForceLocalAccess(self, self._simulation.state)
 
     @property
@@ -223,6 +246,7 @@ class Force(Compute):
                 "another local_force_arrays context manager")
         if not self._attached:
             raise hoomd.error.DataAccessError("gpu_local_force_arrays")
+        # See cpu_local_force_arrays for why the accessor is not cached.
         return hoomd.md.data.ForceLocalAccessGPU(self, self._simulation.state)
 
 
@@ -389,6 +413,7 @@ class Active(Force):
         # store metadata
         param_dict = ParameterDict(filter=ParticleFilter)
         param_dict["filter"] = filter
+        param_dict._set_special_getset("filter", getter=_get_python_param)
         # set defaults
         self._param_dict.update(param_dict)
 
@@ -441,6 +466,24 @@ class Active(Force):
             trigger, self, rotational_diffusion)
 
 
+def _find_active_manifold_classes():
+    """Map (manifold class name, is GPU) to the C++ active force class."""
+    prefix = 'ActiveForceConstraintCompute'
+    classes = {}
+    for name, cpp_cls in vars(_md).items():
+        manifold_name = name[len(prefix):]
+        if not name.startswith(prefix) or not manifold_name:
+            continue
+        is_gpu = manifold_name.endswith('GPU')
+        if is_gpu:
+            manifold_name = manifold_name[:-len('GPU')]
+        classes[(manifold_name, is_gpu)] = cpp_cls
+    return classes
+
+
+_active_manifold_classes = _find_active_manifold_classes()
+
+
 class ActiveOnManifold(Active):
     r"""Active force on a manifold.
 
@@ -524,14 +567,12 @@ class ActiveOnManifold(Active):
         if not self.manifold_constraint._attached:
             self.manifold_constraint._attach(sim)
 
-        base_class_str = 'ActiveForceConstraintCompute'
-        base_class_str += self.manifold_constraint.__class__.__name__
-        if isinstance(sim.device, hoomd.device.GPU):
-            base_class_str += "GPU"
-        self._cpp_obj = getattr(
-            _md, base_class_str)(sim.state._cpp_sys_def,
-                                 sim.state._get_group(self.filter),
-                                 self.manifold_constraint._cpp_obj)
+        key = (self.manifold_constraint.__class__.__name__,
+               isinstance(sim.device, hoomd.device.GPU))
+        cpp_cls = _active_manifold_classes[key]
+        self._cpp_obj = cpp_cls(sim.state._cpp_sys_def,
+                                sim.state._get_group(self.filter),
+                                self.manifold_constraint._cpp_obj)
 
 
 class Constant(Force):
@@ -3,6 +3,7 @@
 
 import hoomd
 import numpy
+import pytest
 
 
 def test_per_particle_virial(simulation_factory, lattice_snapshot_factory):
@@ -42,4 +43,28 @@ def test_per_particle_virial(simulation_factory, lattice_snapshot_factory):
         assert numpy.sum(virials * virials) > 0.0
 
 
+def test_recompute_after_set_snapshot(simulation_factory,
+                                      two_particle_snapshot_factory):
+    cell = hoomd.md.nlist.Cell(buffer=0.4)
+    lj = hoomd.md.pair.LJ(nlist=cell)
+    lj.params[('A', 'A')] = dict(sigma=1.0, epsilon=1.0)
+    lj.r_cut[('A', 'A')] = 2.5
+
+    sim = simulation_factory(two_particle_snapshot_factory(d=1.1))
+    sim.operations.integrator = hoomd.md.Integrator(dt=0.005, forces=[lj])
+    sim.run(0)
+
+    def lj_energy(r):
+        return 4 * (r**-12 - r**-6)
+
+    assert lj.energy == pytest.approx(lj_energy(1.1))
+
+    # Setting a snapshot sorts the particles, so reading the energy on the
+    # same timestep must recompute the forces.
+    timestep = sim.timestep
+    sim.state.set_snapshot(two_particle_snapshot_factory(d=1.3))
+    assert sim.timestep == timestep
+    assert lj.energy == pytest.approx(lj_energy(1.3))
+
+
 # TODO: test compute thermo once it is implemented
@@ -1298,6 +1298,21 @@ def test_adding_to_operations(simulation_factory,
     assert lj.energy != 0
 
 
+def test_energy_sum(simulation_factory, lattice_snapshot_factory):
+    """Test that the total energy matches the sum of per-particle energies."""
+    sim = simulation_factory(lattice_snapshot_factory(n=10, a=1.1, r=0.1))
+    lj = hoomd.md.pair.LJ(nlist=hoomd.md.nlist.Cell(0.4))
+    lj.r_cut.default = 2.5
+    lj.params.default = {"epsilon": 1.0, "sigma": 1.0}
+    sim.operations += lj
+    sim.run(0)
+
+    energy = lj.energy
+    energies = lj.energies
+    if sim.device.communicator.rank == 0:
+        np.testing.assert_allclose(energy, np.sum(energies), rtol=1e-5)
+
+
 def test_forces_multiple_lists(simulation_factory,
                                two_particle_snapshot_factory):
     """Test that forces added to an integrator and compute work correctly.
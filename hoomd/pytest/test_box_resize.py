@@ -18,15 +18,16 @@ _n_points = 10
 
 
 @pytest.fixture(scope="function")
-def fractional_coordinates(n=_n_points):
+def fractional_coordinates(rng, n=_n_points):
     """Return fractional coordinates for testing.
 
     Args:
+        rng: Seeded random number generator.
         n: number of particles
 
     Returns: absolute fractional coordinates
     """
-    return np.random.uniform(-0.5, 0.5, size=(n, 3))
+    return rng.uniform(-0.5, 0.5, size=(n, 3))
 
 
 _box = (
@@ -62,7 +63,8 @@ def sys(request, fractional_coordinates):
 
 def make_system(fractional_coordinates, box):
     hoomd_box = hoomd.Box.from_box(box)
-    points = fractional_coordinates @ hoomd_box.to_matrix().T
+    box_matrix_t = np.ascontiguousarray(hoomd_box.to_matrix().T)
+    points = fractional_coordinates @ box_matrix_t
     return (hoomd_box, points)
 
 
@@ -76,13 +78,21 @@ def trigger():
     return hoomd.trigger.After(_t_mid - 1)
 
 
-def make_sys_halfway(fractional_coordinates, box_start, box_end, power):
-    box_start = np.array(box_start)
-    box_end = np.array(box_end)
+def interpolate_box(box_start, box_end, t, power):
+    """Interpolate box parameters with a power law.
+
+    Interpolates in place to avoid temporary arrays.
+    """
+    box = np.subtract(box_end, box_start)
+    box *= t**power
+    box += box_start
+    return box
 
+
+def make_sys_halfway(fractional_coordinates, box_start, box_end, power):
     intermediate_t = (_t_mid - _t_start) / _t_ramp  # set to halfway, 0.5
-    box_mid = hoomd.Box.from_box(box_start + (box_end - box_start)
-                                 * intermediate_t**power)
+    box_mid = hoomd.Box.from_box(
+        interpolate_box(box_start, box_end, intermediate_t, power))
     return make_system(fractional_coordinates, box_mid)
 
 
@@ -122,31 +132,38 @@ def box_resize(sys, trigger, variant):
 
 
 def assert_positions(sim, reference_points, filter=None):
+    N_particles = sim.state.N_particles
     with sim.state.cpu_local_snapshot as data:
+        # Convert the tags to the native index type once and reuse them for
+        # all indexing below.
+        tags = data.particles.tag.astype(np.intp, copy=False)
         if filter is not None:
-            filter_tags = np.copy(filter(sim.state)).astype(int)
-            is_particle_local = np.isin(data.particles.tag,
-                                        filter_tags,
-                                        assume_unique=True)
-            reference_point = reference_points[
-                data.particles.tag[is_particle_local]]
+            filter_tags = np.asarray(filter(sim.state), dtype=np.intp)
+            # tags are dense in [0, N_particles), index a mask by tag
+            in_filter = np.zeros(N_particles, dtype=bool)
+            in_filter[filter_tags] = True
+            is_particle_local = in_filter[tags]
+            reference_point = reference_points[tags[is_particle_local]]
             pos = data.particles.position[is_particle_local]
         else:
-            pos = data.particles.position[data.particles.rtag[
-                data.particles.tag]]
-            reference_point = reference_points[data.particles.tag]
+            pos = data.particles.position[data.particles.rtag[tags]]
+            reference_point = reference_points[tags]
         npt.assert_allclose(pos, reference_point)
 
 
 def test_trigger(box_resize, trigger):
     assert trigger.timestep == box_resize.trigger.timestep
-    for timestep in range(_t_start + _t_ramp):
-        assert trigger.compute(timestep) == box_resize.trigger.compute(timestep)
+    timesteps = range(_t_start + _t_ramp)
+    expected = [trigger.compute(timestep) for timestep in timesteps]
+    actual = [box_resize.trigger.compute(timestep) for timestep in timesteps]
+    assert actual == expected
 
 
 def test_variant(box_resize, variant):
-    for timestep in range(_t_start + _t_ramp):
-        assert variant(timestep) == box_resize.variant(timestep)
+    timesteps = range(_t_start + _t_ramp)
+    expected = [variant(timestep) for timestep in timesteps]
+    actual = [box_resize.variant(timestep) for timestep in timesteps]
+    assert actual == expected
 
 
 def test_get_box(simulation_factory, get_snapshot, sys, box_resize):
@@ -171,13 +188,14 @@ def test_update(simulation_factory, get_snapshot, sys):
     assert_positions(sim, sys2[1])
 
 
-_filter = ([[hoomd.filter.All(), hoomd.filter.Null()],
-            [hoomd.filter.Null(), hoomd.filter.All()],
-            [
-                hoomd.filter.Tags([0, 5]),
-                hoomd.filter.SetDifference(hoomd.filter.Tags([0]),
-                                           hoomd.filter.All())
-            ]])
+# Share filter instances between parameter sets so that each is constructed
+# once per module.
+_all = hoomd.filter.All()
+_null = hoomd.filter.Null()
+_tags = hoomd.filter.Tags([0, 5])
+_set_difference = hoomd.filter.SetDifference(hoomd.filter.Tags([0]), _all)
+
+_filter = ([[_all, _null], [_null, _all], [_tags, _set_difference]])
 
 
 @pytest.fixture(scope="function", params=_filter, ids=["All", "None", "Tags"])
@@ -84,6 +84,11 @@ class LoadBalancer(Tuner):
         max_iterations (int): Maximum number of iterations to
             attempt in a single step.
     """
+    _param_schema = dict(x=bool,
+                         y=bool,
+                         z=bool,
+                         max_iterations=int,
+                         tolerance=float)
 
     def __init__(self,
                  trigger,
@@ -94,18 +99,13 @@ class LoadBalancer(Tuner):
                  max_iterations=1):
         super().__init__(trigger)
 
-        defaults = dict(x=x,
-                        y=y,
-                        z=z,
-                        tolerance=tolerance,
-                        max_iterations=max_iterations)
-        load_balancer_params = ParameterDict(x=bool,
-                                             y=bool,
-                                             z=bool,
-                                             max_iterations=int,
-                                             tolerance=float)
-        self._param_dict.update(load_balancer_params)
-        self._param_dict.update(defaults)
+        self._param_dict.update(ParameterDict(**self._param_schema))
+        self._param_dict.update(
+            dict(x=x,
+                 y=y,
+                 z=z,
+                 tolerance=tolerance,
+                 max_iterations=max_iterations))
 
     def _attach_hook(self):
         if isinstance(self._simulation.device, hoomd.device.GPU):